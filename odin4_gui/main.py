@@ -1,15 +1,33 @@
+import fnmatch
 import json
 import os
+import re
 import shlex
 import shutil
-import signal
 import sys
+import time
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Set
 
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6 import QtCore, QtWidgets
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
 
 APP_DIR = Path(__file__).resolve().parent
 ROOT_DIR = APP_DIR.parent
@@ -18,6 +36,7 @@ THEME_PATH = BUNDLE_DIR / "theme.qss"
 DEFAULT_PROFILES_PATH = BUNDLE_DIR / "profiles" / "devices.json"
 
 
+@lru_cache(maxsize=1)
 def _config_dir() -> Path:
     base = Path(
         QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.AppConfigLocation)
@@ -26,6 +45,7 @@ def _config_dir() -> Path:
     return base
 
 
+@lru_cache(maxsize=1)
 def _profiles_path() -> Path:
     config_dir = _config_dir()
     user_profiles = config_dir / "devices.json"
@@ -37,10 +57,39 @@ def _profiles_path() -> Path:
     return user_profiles if user_profiles.exists() else DEFAULT_PROFILES_PATH
 
 
+@lru_cache(maxsize=1)
 def _settings_path() -> Path:
     return _config_dir() / "settings.json"
 
 
+def _invalidate_paths() -> None:
+    for cached in (_config_dir, _profiles_path, _settings_path):
+        cached.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _load_theme_qss() -> str:
+    # Prefer the stylesheet embedded at build time by tools/embed_theme.py;
+    # main.py runs both as a package module and as a bare script, so try
+    # the relative import first and the top-level one second.
+    try:
+        from ._theme_qss import THEME_QSS
+    except ImportError:
+        try:
+            from _theme_qss import THEME_QSS
+        except ImportError:
+            THEME_QSS = ""
+    if THEME_QSS:
+        return THEME_QSS
+    if not THEME_PATH.exists():
+        return ""
+    try:
+        return THEME_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+@lru_cache(maxsize=1)
 def _default_odin_path() -> str:
     bundle_odin = BUNDLE_DIR / "odin4"
     if bundle_odin.exists():
@@ -51,6 +100,7 @@ def _default_odin_path() -> str:
     return ""
 
 
+@lru_cache(maxsize=1)
 def _default_adb_path() -> str:
     bundle_adb = BUNDLE_DIR / "adb"
     if bundle_adb.exists():
@@ -59,213 +109,264 @@ def _default_adb_path() -> str:
     return system_adb or ""
 
 
+@lru_cache(maxsize=1)
 def _default_language() -> str:
     return "ru" if QtCore.QLocale.system().language() == QtCore.QLocale.Russian else "en"
 
 
-FILE_KEYS = ["BL", "AP", "CP", "CSC", "UMS"]
-
-STRINGS = {
-    "en": {
-        "app_title": "odin",
-        "brand": "odin",
-        "sub_brand": "Odin4 wrapper + tools",
-        "author": "Valentin Stars",
-        "nav_flash": "Flash",
-        "nav_adb": "ADB",
-        "nav_profiles": "Profiles",
-        "nav_logs": "Logs",
-        "nav_settings": "Settings",
-        "status_idle": "Idle",
-        "status_flashing": "Flashing...",
-        "device_not_checked": "Device: not checked",
-        "device_not_found": "Device: not found",
-        "device_found": "Device: {count} found",
-        "group_odin": "Odin4 Binary",
-        "group_firmware": "Firmware Files",
-        "group_auto_detect": "Auto-detect Firmware Folder",
-        "group_device": "Target Device",
-        "group_options": "Options",
-        "group_actions": "Safety and Actions",
-        "group_adb": "ADB Binary",
-        "group_adb_devices": "ADB Devices",
-        "group_quick_actions": "Quick Actions",
-        "group_file_ops": "File Operations",
-        "group_adb_shell": "ADB Shell",
-        "group_profiles": "Device Profiles",
-        "group_logs": "Logs",
-        "group_settings": "App Settings",
-        "ph_odin_path": "Path to odin4",
-        "ph_select_file": "Select {key} file",
-        "ph_fw_folder": "Folder with BL/AP/CP/CSC files",
-        "ph_device_path": "Manual device path (optional)",
-        "ph_command_preview": "Command preview",
-        "ph_adb_path": "Path to adb",
-        "ph_adb_push_local": "Local file to push",
-        "ph_adb_pull_remote": "Remote path to pull",
-        "ph_adb_pull_local": "Local folder",
-        "ph_adb_install_apk": "APK to install",
-        "ph_adb_shell_cmd": "getprop ro.product.model",
-        "btn_browse": "Browse",
-        "btn_auto_detect": "Auto-detect",
-        "btn_clear": "Clear",
-        "btn_scan": "Scan",
-        "btn_refresh": "Refresh",
-        "btn_copy": "Copy",
-        "btn_flash": "Flash",
-        "btn_stop": "Stop",
-        "chk_prefer_home_csc": "Prefer HOME_CSC",
-        "chk_nand_erase": "Nand erase (-e)",
-        "chk_home_validate": "Home validation (-V)",
-        "chk_reboot": "Reboot (--reboot)",
-        "chk_redownload": "Redownload (--redownload)",
-        "chk_confirm_risk": "I understand the risks",
-        "chk_confirm_download": "Device is in Download Mode",
-        "combo_auto_device": "Auto-detect (no -d)",
-        "combo_all_devices": "All devices",
-        "combo_no_profile": "No profile",
-        "btn_reboot_download": "Reboot to Download",
-        "btn_reboot_recovery": "Reboot to Recovery",
-        "btn_reboot_system": "Reboot System",
-        "btn_kill_adb": "Kill ADB Server",
-        "btn_start_adb": "Start ADB Server",
-        "btn_push": "Push",
-        "btn_pull": "Pull",
-        "btn_install_apk": "Install APK",
-        "btn_run": "Run",
-        "btn_load_folder": "Load Firmware Folder",
-        "btn_apply_profile": "Apply to Flash",
-        "btn_flash_stock": "Flash Stock",
-        "btn_open_profiles": "Open profiles file",
-        "btn_save_log": "Save Log",
-        "btn_clear_log": "Clear",
-        "chk_autoscroll": "Auto-scroll logs",
-        "chk_timestamp": "Timestamps in logs",
-        "lbl_theme": "Theme",
-        "lbl_language": "Language",
-        "theme_custom": "Odin VST",
-        "theme_qt": "Qt Default",
-        "lang_ru": "Russian",
-        "lang_en": "English",
-        "no_devices": "No devices",
-        "profile_none": "No profile selected",
-        "profile_name": "Name",
-        "profile_model": "Model",
-        "profile_notes": "Notes",
-        "profile_patterns": "Patterns",
-        "profile_flags": "Flags",
-        "dlg_confirm_title": "Confirm Flash",
-        "dlg_confirm_text": "Flashing can brick devices. Continue?",
-        "dlg_select_odin": "Select odin4",
-        "dlg_select_adb": "Select adb",
-        "dlg_select_file": "Select {key} file",
-        "dlg_select_folder": "Select firmware folder",
-        "dlg_select_push": "Select file to push",
-        "dlg_select_pull_folder": "Select local folder",
-        "dlg_select_apk": "Select APK",
-        "dlg_save_log": "Save log",
-    },
-    "ru": {
-        "app_title": "odin",
-        "brand": "odin",
-        "sub_brand": "Оболочка Odin4 + инструменты",
-        "author": "Valentin Stars",
-        "nav_flash": "Прошивка",
-        "nav_adb": "ADB",
-        "nav_profiles": "Профили",
-        "nav_logs": "Логи",
-        "nav_settings": "Настройки",
-        "status_idle": "Ожидание",
-        "status_flashing": "Прошивка...",
-        "device_not_checked": "Устройство: не проверено",
-        "device_not_found": "Устройство: не найдено",
-        "device_found": "Устройств найдено: {count}",
-        "group_odin": "Файл Odin4",
-        "group_firmware": "Файлы прошивки",
-        "group_auto_detect": "Автопоиск папки прошивки",
-        "group_device": "Устройство",
-        "group_options": "Опции",
-        "group_actions": "Безопасность и действия",
-        "group_adb": "Файл ADB",
-        "group_adb_devices": "ADB устройства",
-        "group_quick_actions": "Быстрые действия",
-        "group_file_ops": "Файловые операции",
-        "group_adb_shell": "ADB Shell",
-        "group_profiles": "Профили устройств",
-        "group_logs": "Логи",
-        "group_settings": "Настройки приложения",
-        "ph_odin_path": "Путь к odin4",
-        "ph_select_file": "Выбрать файл {key}",
-        "ph_fw_folder": "Папка с BL/AP/CP/CSC файлами",
-        "ph_device_path": "Путь к устройству (опционально)",
-        "ph_command_preview": "Предпросмотр команды",
-        "ph_adb_path": "Путь к adb",
-        "ph_adb_push_local": "Локальный файл для push",
-        "ph_adb_pull_remote": "Удаленный путь для pull",
-        "ph_adb_pull_local": "Локальная папка",
-        "ph_adb_install_apk": "APK для установки",
-        "ph_adb_shell_cmd": "getprop ro.product.model",
-        "btn_browse": "Обзор",
-        "btn_auto_detect": "Авто-поиск",
-        "btn_clear": "Очистить",
-        "btn_scan": "Сканировать",
-        "btn_refresh": "Обновить",
-        "btn_copy": "Копировать",
-        "btn_flash": "Прошить",
-        "btn_stop": "Стоп",
-        "chk_prefer_home_csc": "Предпочитать HOME_CSC",
-        "chk_nand_erase": "Стереть NAND (-e)",
-        "chk_home_validate": "Проверка HOME (-V)",
-        "chk_reboot": "Перезагрузка (--reboot)",
-        "chk_redownload": "Перезаход в Download (--redownload)",
-        "chk_confirm_risk": "Я понимаю риски",
-        "chk_confirm_download": "Устройство в Download Mode",
-        "combo_auto_device": "Авто-определение (без -d)",
-        "combo_all_devices": "Все устройства",
-        "combo_no_profile": "Без профиля",
-        "btn_reboot_download": "Ребут в Download",
-        "btn_reboot_recovery": "Ребут в Recovery",
-        "btn_reboot_system": "Ребут системы",
-        "btn_kill_adb": "Остановить ADB",
-        "btn_start_adb": "Запустить ADB",
-        "btn_push": "Push",
-        "btn_pull": "Pull",
-        "btn_install_apk": "Установить APK",
-        "btn_run": "Выполнить",
-        "btn_load_folder": "Загрузить папку прошивки",
-        "btn_apply_profile": "Применить к прошивке",
-        "btn_flash_stock": "Прошить сток",
-        "btn_open_profiles": "Открыть файл профилей",
-        "btn_save_log": "Сохранить лог",
-        "btn_clear_log": "Очистить",
-        "chk_autoscroll": "Автопрокрутка логов",
-        "chk_timestamp": "Временные метки в логах",
-        "lbl_theme": "Тема",
-        "lbl_language": "Язык",
-        "theme_custom": "Odin VST",
-        "theme_qt": "Стандартная Qt",
-        "lang_ru": "Русский",
-        "lang_en": "Английский",
-        "no_devices": "Устройств нет",
-        "profile_none": "Профиль не выбран",
-        "profile_name": "Имя",
-        "profile_model": "Модель",
-        "profile_notes": "Заметки",
-        "profile_patterns": "Шаблоны",
-        "profile_flags": "Флаги",
-        "dlg_confirm_title": "Подтверждение прошивки",
-        "dlg_confirm_text": "Прошивка может повредить устройство. Продолжить?",
-        "dlg_select_odin": "Выберите odin4",
-        "dlg_select_adb": "Выберите adb",
-        "dlg_select_file": "Выберите файл {key}",
-        "dlg_select_folder": "Выберите папку прошивки",
-        "dlg_select_push": "Выберите файл для push",
-        "dlg_select_pull_folder": "Выберите локальную папку",
-        "dlg_select_apk": "Выберите APK",
-        "dlg_save_log": "Сохранить лог",
-    },
+FILE_KEYS = ("BL", "AP", "CP", "CSC", "UMS")
+
+NAV_KEYS = ("flash", "adb", "profiles", "logs", "settings")
+
+FILE_FLAGS = (("BL", "-b"), ("AP", "-a"), ("CP", "-c"), ("CSC", "-s"), ("UMS", "-u"))
+
+DEFAULT_FW_PATTERNS = {
+    "BL": "BL_*.tar.md5",
+    "AP": "AP_*.tar.md5",
+    "CP": "CP_*.tar.md5",
+    "CSC": "CSC_*.tar.md5",
+    "HOME_CSC": "HOME_CSC_*.tar.md5",
+}
+
+PROCESS_ERROR_MESSAGES = {
+    QtCore.QProcess.FailedToStart: "Process error: failed to start",
+    QtCore.QProcess.Crashed: "Process error: crashed",
+    QtCore.QProcess.Timedout: "Process error: timed out",
+    QtCore.QProcess.WriteError: "Process error: write error",
+    QtCore.QProcess.ReadError: "Process error: read error",
+    QtCore.QProcess.UnknownError: "Process error: unknown",
 }
 
+SETTINGS_FLAG_DEFAULTS = (
+    ("nand_erase", False),
+    ("home_validate", False),
+    ("reboot", True),
+    ("redownload", False),
+)
+
+LOG_BUFFER_CAP = 1_000_000  # bytes kept for log export; widget keeps its own block cap
+
+_I18N_SETTERS = {
+    "text": "setText",
+    "title": "setTitle",
+    "placeholder": "setPlaceholderText",
+}
+
+_STRINGS_EN = MappingProxyType({
+    "app_title": "odin",
+    "brand": "odin",
+    "sub_brand": "Odin4 wrapper + tools",
+    "author": "Valentin Stars",
+    "nav_flash": "Flash",
+    "nav_adb": "ADB",
+    "nav_profiles": "Profiles",
+    "nav_logs": "Logs",
+    "nav_settings": "Settings",
+    "status_idle": "Idle",
+    "status_flashing": "Flashing...",
+    "device_not_checked": "Device: not checked",
+    "device_not_found": "Device: not found",
+    "device_found": "Device: {count} found",
+    "group_odin": "Odin4 Binary",
+    "group_firmware": "Firmware Files",
+    "group_auto_detect": "Auto-detect Firmware Folder",
+    "group_device": "Target Device",
+    "group_options": "Options",
+    "group_actions": "Safety and Actions",
+    "group_adb": "ADB Binary",
+    "group_adb_devices": "ADB Devices",
+    "group_quick_actions": "Quick Actions",
+    "group_file_ops": "File Operations",
+    "group_adb_shell": "ADB Shell",
+    "group_profiles": "Device Profiles",
+    "group_logs": "Logs",
+    "group_settings": "App Settings",
+    "ph_odin_path": "Path to odin4",
+    "ph_select_file": "Select {key} file",
+    "ph_fw_folder": "Folder with BL/AP/CP/CSC files",
+    "ph_device_path": "Manual device path (optional)",
+    "ph_command_preview": "Command preview",
+    "ph_adb_path": "Path to adb",
+    "ph_adb_push_local": "Local file to push",
+    "ph_adb_pull_remote": "Remote path to pull",
+    "ph_adb_pull_local": "Local folder",
+    "ph_adb_install_apk": "APK to install",
+    "ph_adb_shell_cmd": "getprop ro.product.model",
+    "btn_browse": "Browse",
+    "btn_auto_detect": "Auto-detect",
+    "btn_clear": "Clear",
+    "btn_scan": "Scan",
+    "btn_refresh": "Refresh",
+    "btn_copy": "Copy",
+    "btn_flash": "Flash",
+    "btn_stop": "Stop",
+    "chk_prefer_home_csc": "Prefer HOME_CSC",
+    "chk_nand_erase": "Nand erase (-e)",
+    "chk_home_validate": "Home validation (-V)",
+    "chk_reboot": "Reboot (--reboot)",
+    "chk_redownload": "Redownload (--redownload)",
+    "chk_confirm_risk": "I understand the risks",
+    "chk_confirm_download": "Device is in Download Mode",
+    "combo_auto_device": "Auto-detect (no -d)",
+    "combo_all_devices": "All devices",
+    "combo_no_profile": "No profile",
+    "btn_reboot_download": "Reboot to Download",
+    "btn_reboot_recovery": "Reboot to Recovery",
+    "btn_reboot_system": "Reboot System",
+    "btn_kill_adb": "Kill ADB Server",
+    "btn_start_adb": "Start ADB Server",
+    "btn_push": "Push",
+    "btn_pull": "Pull",
+    "btn_install_apk": "Install APK",
+    "btn_run": "Run",
+    "btn_load_folder": "Load Firmware Folder",
+    "btn_apply_profile": "Apply to Flash",
+    "btn_flash_stock": "Flash Stock",
+    "btn_open_profiles": "Open profiles file",
+    "btn_save_log": "Save Log",
+    "btn_clear_log": "Clear",
+    "chk_autoscroll": "Auto-scroll logs",
+    "chk_timestamp": "Timestamps in logs",
+    "lbl_theme": "Theme",
+    "lbl_language": "Language",
+    "theme_custom": "Odin VST",
+    "theme_qt": "Qt Default",
+    "lang_ru": "Russian",
+    "lang_en": "English",
+    "no_devices": "No devices",
+    "profile_none": "No profile selected",
+    "profile_name": "Name",
+    "profile_model": "Model",
+    "profile_notes": "Notes",
+    "profile_patterns": "Patterns",
+    "profile_flags": "Flags",
+    "dlg_confirm_title": "Confirm Flash",
+    "dlg_confirm_text": "Flashing can brick devices. Continue?",
+    "dlg_select_odin": "Select odin4",
+    "dlg_select_adb": "Select adb",
+    "dlg_select_file": "Select {key} file",
+    "dlg_select_folder": "Select firmware folder",
+    "dlg_select_push": "Select file to push",
+    "dlg_select_pull_folder": "Select local folder",
+    "dlg_select_apk": "Select APK",
+    "dlg_save_log": "Save log",
+})
+
+_STRINGS_RU = MappingProxyType({
+    "app_title": "odin",
+    "brand": "odin",
+    "sub_brand": "Оболочка Odin4 + инструменты",
+    "author": "Valentin Stars",
+    "nav_flash": "Прошивка",
+    "nav_adb": "ADB",
+    "nav_profiles": "Профили",
+    "nav_logs": "Логи",
+    "nav_settings": "Настройки",
+    "status_idle": "Ожидание",
+    "status_flashing": "Прошивка...",
+    "device_not_checked": "Устройство: не проверено",
+    "device_not_found": "Устройство: не найдено",
+    "device_found": "Устройств найдено: {count}",
+    "group_odin": "Файл Odin4",
+    "group_firmware": "Файлы прошивки",
+    "group_auto_detect": "Автопоиск папки прошивки",
+    "group_device": "Устройство",
+    "group_options": "Опции",
+    "group_actions": "Безопасность и действия",
+    "group_adb": "Файл ADB",
+    "group_adb_devices": "ADB устройства",
+    "group_quick_actions": "Быстрые действия",
+    "group_file_ops": "Файловые операции",
+    "group_adb_shell": "ADB Shell",
+    "group_profiles": "Профили устройств",
+    "group_logs": "Логи",
+    "group_settings": "Настройки приложения",
+    "ph_odin_path": "Путь к odin4",
+    "ph_select_file": "Выбрать файл {key}",
+    "ph_fw_folder": "Папка с BL/AP/CP/CSC файлами",
+    "ph_device_path": "Путь к устройству (опционально)",
+    "ph_command_preview": "Предпросмотр команды",
+    "ph_adb_path": "Путь к adb",
+    "ph_adb_push_local": "Локальный файл для push",
+    "ph_adb_pull_remote": "Удаленный путь для pull",
+    "ph_adb_pull_local": "Локальная папка",
+    "ph_adb_install_apk": "APK для установки",
+    "ph_adb_shell_cmd": "getprop ro.product.model",
+    "btn_browse": "Обзор",
+    "btn_auto_detect": "Авто-поиск",
+    "btn_clear": "Очистить",
+    "btn_scan": "Сканировать",
+    "btn_refresh": "Обновить",
+    "btn_copy": "Копировать",
+    "btn_flash": "Прошить",
+    "btn_stop": "Стоп",
+    "chk_prefer_home_csc": "Предпочитать HOME_CSC",
+    "chk_nand_erase": "Стереть NAND (-e)",
+    "chk_home_validate": "Проверка HOME (-V)",
+    "chk_reboot": "Перезагрузка (--reboot)",
+    "chk_redownload": "Перезаход в Download (--redownload)",
+    "chk_confirm_risk": "Я понимаю риски",
+    "chk_confirm_download": "Устройство в Download Mode",
+    "combo_auto_device": "Авто-определение (без -d)",
+    "combo_all_devices": "Все устройства",
+    "combo_no_profile": "Без профиля",
+    "btn_reboot_download": "Ребут в Download",
+    "btn_reboot_recovery": "Ребут в Recovery",
+    "btn_reboot_system": "Ребут системы",
+    "btn_kill_adb": "Остановить ADB",
+    "btn_start_adb": "Запустить ADB",
+    "btn_push": "Push",
+    "btn_pull": "Pull",
+    "btn_install_apk": "Установить APK",
+    "btn_run": "Выполнить",
+    "btn_load_folder": "Загрузить папку прошивки",
+    "btn_apply_profile": "Применить к прошивке",
+    "btn_flash_stock": "Прошить сток",
+    "btn_open_profiles": "Открыть файл профилей",
+    "btn_save_log": "Сохранить лог",
+    "btn_clear_log": "Очистить",
+    "chk_autoscroll": "Автопрокрутка логов",
+    "chk_timestamp": "Временные метки в логах",
+    "lbl_theme": "Тема",
+    "lbl_language": "Язык",
+    "theme_custom": "Odin VST",
+    "theme_qt": "Стандартная Qt",
+    "lang_ru": "Русский",
+    "lang_en": "Английский",
+    "no_devices": "Устройств нет",
+    "profile_none": "Профиль не выбран",
+    "profile_name": "Имя",
+    "profile_model": "Модель",
+    "profile_notes": "Заметки",
+    "profile_patterns": "Шаблоны",
+    "profile_flags": "Флаги",
+    "dlg_confirm_title": "Подтверждение прошивки",
+    "dlg_confirm_text": "Прошивка может повредить устройство. Продолжить?",
+    "dlg_select_odin": "Выберите odin4",
+    "dlg_select_adb": "Выберите adb",
+    "dlg_select_file": "Выберите файл {key}",
+    "dlg_select_folder": "Выберите папку прошивки",
+    "dlg_select_push": "Выберите файл для push",
+    "dlg_select_pull_folder": "Выберите локальную папку",
+    "dlg_select_apk": "Выберите APK",
+    "dlg_save_log": "Сохранить лог",
+})
+
+
+@lru_cache(maxsize=None)
+def _strings_for(lang: str) -> Mapping[str, str]:
+    return _STRINGS_RU if lang == "ru" else _STRINGS_EN
+
+
+@lru_cache(maxsize=512)
+def _format_string(template: str, args: tuple) -> str:
+    # Keyed on the template itself, so per-language entries never collide and
+    # a language switch needs no cache invalidation.
+    try:
+        return template.format(**dict(args))
+    except (KeyError, ValueError):
+        return template
+
 
 @dataclass
 class Profile:
@@ -283,8 +384,7 @@ def load_profiles() -> List[Profile]:
     if not profiles_path.exists():
         return []
     try:
-        with profiles_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = _loads(profiles_path.read_bytes())
         profiles = []
         for item in data.get("profiles", []):
             profiles.append(
@@ -299,7 +399,7 @@ def load_profiles() -> List[Profile]:
                 )
             )
         return profiles
-    except (OSError, json.JSONDecodeError):
+    except (OSError, ValueError):
         return []
 
 
@@ -308,45 +408,138 @@ def load_settings() -> Dict:
     if not settings_path.exists():
         return {}
     try:
-        with settings_path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (OSError, json.JSONDecodeError):
+        return _loads(settings_path.read_bytes())
+    except (OSError, ValueError):
         return {}
 
 
 def save_settings(settings: Dict) -> None:
     settings_path = _settings_path()
+    tmp_path = settings_path.with_suffix(".json.tmp")
     try:
-        with settings_path.open("w", encoding="utf-8") as handle:
-            json.dump(settings, handle, indent=2)
+        tmp_path.write_bytes(_dumps(settings))
+        os.replace(tmp_path, settings_path)
     except OSError:
         pass
 
 
 def find_first_match(folder: Path, pattern: str) -> Optional[Path]:
-    matches = sorted(folder.glob(pattern))
-    return matches[0] if matches else None
+    if not pattern:
+        return None
+    return min(folder.glob(pattern), key=lambda path: path.name, default=None)
+
+
+_SAFE_ARG = re.compile(r"\A[\w@%+=:,./-]+\Z", re.ASCII).match
+
+
+def _delete_process_later(process: QtCore.QProcess) -> None:
+    # Qt can emit finished() while tearing the process down with the window,
+    # at which point the C++ object is already gone under the Python wrapper.
+    try:
+        process.deleteLater()
+    except RuntimeError:
+        pass
+
+
+def _quote_arg(part: str) -> str:
+    return part if _SAFE_ARG(part) else shlex.quote(part)
+
+
+def _fuse_patterns(patterns: Dict[str, str]):
+    keys = [key for key, pattern in patterns.items() if pattern]
+    if not keys:
+        return None, ()
+    # The fused alternation is only a prefilter; patterns may overlap (they
+    # come from user-editable profiles), so a hit is credited per key by its
+    # own compiled pattern rather than by which alternative matched first.
+    regexes = tuple(
+        (key, re.compile(fnmatch.translate(patterns[key]))) for key in keys
+    )
+    fused = re.compile(
+        "|".join(f"(?:{fnmatch.translate(patterns[key])})" for key in keys)
+    )
+    return fused, regexes
 
 
 def detect_firmware(folder: Path, patterns: Dict[str, str], prefer_home_csc: bool) -> Dict[str, Optional[Path]]:
+    fused, regexes = _fuse_patterns(patterns)
+    best: Dict[str, Optional[str]] = {key: None for key, _regex in regexes}
+    if fused is not None:
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if fused.match(name) is None:
+                        continue
+                    for key, regex in regexes:
+                        if regex.match(name) and (best[key] is None or name < best[key]):
+                            best[key] = name
+        except OSError:
+            pass
+
     result: Dict[str, Optional[Path]] = {key: None for key in FILE_KEYS}
-    bl = find_first_match(folder, patterns.get("BL", "")) if patterns.get("BL") else None
-    ap = find_first_match(folder, patterns.get("AP", "")) if patterns.get("AP") else None
-    cp = find_first_match(folder, patterns.get("CP", "")) if patterns.get("CP") else None
-    csc = find_first_match(folder, patterns.get("CSC", "")) if patterns.get("CSC") else None
-    home_csc = find_first_match(folder, patterns.get("HOME_CSC", "")) if patterns.get("HOME_CSC") else None
-
-    result["BL"] = bl
-    result["AP"] = ap
-    result["CP"] = cp
+    for key in ("BL", "AP", "CP"):
+        if best.get(key) is not None:
+            result[key] = folder / best[key]
+    home_csc = best.get("HOME_CSC")
+    csc = best.get("CSC")
     if prefer_home_csc and home_csc is not None:
-        result["CSC"] = home_csc
-    else:
-        result["CSC"] = csc
+        result["CSC"] = folder / home_csc
+    elif csc is not None:
+        result["CSC"] = folder / csc
     return result
 
 
+class _PreflightSignals(QtCore.QObject):
+    finished = QtCore.Signal(dict)
+
+
+class PreflightRunnable(QtCore.QRunnable):
+    """Stats the odin4 binary off the GUI thread before a flash starts."""
+
+    def __init__(self, cmd: List[str], has_files: bool) -> None:
+        super().__init__()
+        self.cmd = cmd
+        self.has_files = has_files
+        self.signals = _PreflightSignals()
+
+    def run(self) -> None:
+        self.signals.finished.emit(
+            {
+                "cmd": self.cmd,
+                "odin_exists": Path(self.cmd[0]).exists(),
+                "has_files": self.has_files,
+            }
+        )
+
+
+class OutputDecodeRunnable(QtCore.QRunnable):
+    """Decodes a finished process's captured output off the GUI thread."""
+
+    def __init__(self, stdout_buf: bytearray, stderr_buf: bytearray, exit_code: int) -> None:
+        super().__init__()
+        self.stdout_buf = stdout_buf
+        self.stderr_buf = stderr_buf
+        self.exit_code = exit_code
+        self.signals = _PreflightSignals()
+
+    def run(self) -> None:
+        self.signals.finished.emit(
+            {
+                "stdout": self.stdout_buf.decode("utf-8", errors="replace"),
+                "stderr": self.stderr_buf.decode("utf-8", errors="replace"),
+                "exit_code": self.exit_code,
+            }
+        )
+
+
 class MainWindow(QtWidgets.QMainWindow):
+    _ADB_REBOOT_DOWNLOAD = ("reboot", "download")
+    _ADB_REBOOT_RECOVERY = ("reboot", "recovery")
+    _ADB_REBOOT_SYSTEM = ("reboot",)
+    _ADB_KILL_SERVER = ("kill-server",)
+    _ADB_START_SERVER = ("start-server",)
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("odin")
@@ -357,13 +550,33 @@ class MainWindow(QtWidgets.QMainWindow):
         self.profile_files: Dict[str, Path] = {}
 
         self.current_language = self.settings.get("language", _default_language())
+        self._strings = _strings_for(self.current_language)
+        self._fallback = _strings_for("en")
         self.current_theme = self.settings.get("theme", "custom")
         self.current_status_key = "idle"
         self.last_device_count: Optional[int] = None
 
         self.flash_process: Optional[QtCore.QProcess] = None
-        self.other_processes: List[QtCore.QProcess] = []
-        self.log_lines: List[str] = []
+        self._preflight: Optional[PreflightRunnable] = None
+        self._decode_workers: Set[OutputDecodeRunnable] = set()
+        self._odin_devices_proc: Optional[QtCore.QProcess] = None
+        self._adb_devices_proc: Optional[QtCore.QProcess] = None
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._path_exists_cache: Dict[str, bool] = {}
+        self._odin_path_ok = False
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(40)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._timestamp_cache = (0, "")
+        self._log_view_stale = False
+        self._preview_cmd: Optional[List[str]] = None
+        self.other_processes: Set[QtCore.QProcess] = set()
+        self._log_buffer = bytearray()
+        self._log_pending: List[str] = []
 
         self._build_ui()
         self._apply_settings()
@@ -371,17 +584,31 @@ class MainWindow(QtWidgets.QMainWindow):
         self._apply_language()
         self._refresh_command_preview()
         self._update_flash_ready()
+        QtCore.QTimer.singleShot(500, self._build_remaining_pages)
+
+    @QtCore.Slot()
+    def _build_remaining_pages(self) -> None:
+        # Idle warm-up: build one deferred page per tick so the first click on
+        # any tab is instant without paying for all four during startup.
+        for key in NAV_KEYS:
+            if key not in self.pages:
+                self._ensure_page(key)
+                break
+        else:
+            return
+        QtCore.QTimer.singleShot(100, self._build_remaining_pages)
 
+    @QtCore.Slot()
     def _apply_theme(self) -> None:
-        theme = self.theme_combo.currentData() if hasattr(self, "theme_combo") else None
+        theme = self.theme_combo.currentData() if "settings" in self.pages else None
         if theme:
             self.current_theme = theme
         if self.current_theme == "qt":
             self.setStyleSheet("")
             return
-        if THEME_PATH.exists():
-            with THEME_PATH.open("r", encoding="utf-8") as handle:
-                self.setStyleSheet(handle.read())
+        qss = _load_theme_qss()
+        if qss:
+            self.setStyleSheet(qss)
 
     def _build_ui(self) -> None:
         central = QtWidgets.QWidget()
@@ -397,8 +624,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.brand_label = QtWidgets.QLabel()
         self.brand_label.setObjectName("BrandLabel")
+        self._tr(self.brand_label, "brand")
         self.sub_brand_label = QtWidgets.QLabel()
         self.sub_brand_label.setObjectName("SubBrandLabel")
+        self._tr(self.sub_brand_label, "sub_brand")
         sidebar_layout.addWidget(self.brand_label)
         sidebar_layout.addWidget(self.sub_brand_label)
 
@@ -406,11 +635,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.nav_group.setExclusive(True)
 
         self.nav_buttons: Dict[str, QtWidgets.QToolButton] = {}
-        for key in ["flash", "adb", "profiles", "logs", "settings"]:
+        for key in NAV_KEYS:
             btn = QtWidgets.QToolButton()
             btn.setCheckable(True)
             btn.setToolButtonStyle(QtCore.Qt.ToolButtonTextOnly)
             self.nav_group.addButton(btn)
+            self._tr(btn, f"nav_{key}")
             self.nav_buttons[key] = btn
             sidebar_layout.addWidget(btn)
 
@@ -437,16 +667,14 @@ class MainWindow(QtWidgets.QMainWindow):
         sidebar_layout.addWidget(self.author_label)
 
         self.stack = QtWidgets.QStackedWidget()
-        self.pages = {
-            "flash": self._wrap_scroll(self._build_flash_page()),
-            "adb": self._wrap_scroll(self._build_adb_page()),
-            "profiles": self._wrap_scroll(self._build_profiles_page()),
-            "logs": self._wrap_scroll(self._build_logs_page()),
-            "settings": self._wrap_scroll(self._build_settings_page()),
+        self.page_factories = {
+            "flash": self._build_flash_page,
+            "adb": self._build_adb_page,
+            "profiles": self._build_profiles_page,
+            "logs": self._build_logs_page,
+            "settings": self._build_settings_page,
         }
-
-        for page in self.pages.values():
-            self.stack.addWidget(page)
+        self.pages: Dict[str, QtWidgets.QWidget] = {}
 
         root_layout.addWidget(sidebar, 0)
         root_layout.addWidget(self.stack, 1)
@@ -454,9 +682,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(central)
 
         self.nav_buttons["flash"].setChecked(True)
-        self.stack.setCurrentWidget(self.pages["flash"])
+        self.stack.setCurrentWidget(self._ensure_page("flash"))
         self.nav_group.buttonClicked.connect(self._switch_page)
 
+    def _ensure_page(self, key: str) -> QtWidgets.QWidget:
+        page = self.pages.get(key)
+        if page is None:
+            page = self._wrap_scroll(self.page_factories[key]())
+            self.stack.addWidget(page)
+            self.pages[key] = page
+            self._apply_page_settings(key)
+            self._retranslate_dynamic()
+        return page
+
     def _wrap_scroll(self, widget: QtWidgets.QWidget) -> QtWidgets.QWidget:
         scroll = QtWidgets.QScrollArea()
         scroll.setWidgetResizable(True)
@@ -464,133 +702,69 @@ class MainWindow(QtWidgets.QMainWindow):
         scroll.setWidget(widget)
         return scroll
 
+    def _tr(self, widget: QtCore.QObject, msg_key: str, kind: str = "text", **kwargs) -> None:
+        widget.setProperty(f"_i18n_{kind}", msg_key)
+        if kwargs:
+            widget.setProperty("_i18n_args", kwargs)
+        getattr(widget, _I18N_SETTERS[kind])(self._t(msg_key, **kwargs))
+
+    def _retranslate_widgets(self) -> None:
+        for widget in self.findChildren(QtWidgets.QWidget):
+            args = widget.property("_i18n_args") or {}
+            for kind, setter in _I18N_SETTERS.items():
+                key = widget.property(f"_i18n_{kind}")
+                if key:
+                    getattr(widget, setter)(self._t(key, **args))
+
     def _t(self, msg_key: str, **kwargs) -> str:
-        lang = self.current_language if self.current_language in STRINGS else "en"
-        value = STRINGS.get(lang, {}).get(msg_key) or STRINGS["en"].get(msg_key) or msg_key
-        try:
-            return value.format(**kwargs)
-        except (KeyError, ValueError):
+        value = self._strings.get(msg_key) or self._fallback.get(msg_key) or msg_key
+        if not kwargs:
             return value
+        return _format_string(value, tuple(sorted(kwargs.items())))
 
+    @QtCore.Slot()
     def _apply_language(self) -> None:
-        if hasattr(self, "lang_combo") and self.lang_combo.currentData():
+        if "settings" in self.pages and self.lang_combo.currentData():
             self.current_language = self.lang_combo.currentData()
+        self._strings = _strings_for(self.current_language)
+        self._fallback = _strings_for("en")
+        self._profile_labels = tuple(
+            self._t(key)
+            for key in ("profile_name", "profile_model", "profile_notes",
+                        "profile_patterns", "profile_flags")
+        )
 
         self.setWindowTitle(self._t("app_title"))
-        self.brand_label.setText(self._t("brand"))
-        self.sub_brand_label.setText(self._t("sub_brand"))
         self.author_label.setText(
             f'<a href="https://vstbio.t.me">{self._t("author")}</a>'
         )
 
-        self.nav_buttons["flash"].setText(self._t("nav_flash"))
-        self.nav_buttons["adb"].setText(self._t("nav_adb"))
-        self.nav_buttons["profiles"].setText(self._t("nav_profiles"))
-        self.nav_buttons["logs"].setText(self._t("nav_logs"))
-        self.nav_buttons["settings"].setText(self._t("nav_settings"))
-
         self._set_status(self.current_status_key)
         self._set_device_status(self.last_device_count)
 
-        self.odin_group.setTitle(self._t("group_odin"))
-        self.files_group.setTitle(self._t("group_firmware"))
-        self.detect_group.setTitle(self._t("group_auto_detect"))
-        self.device_group.setTitle(self._t("group_device"))
-        self.options_group.setTitle(self._t("group_options"))
-        self.action_group.setTitle(self._t("group_actions"))
-
-        self.odin_path_edit.setPlaceholderText(self._t("ph_odin_path"))
-        for key, edit in self.file_edits.items():
-            edit.setPlaceholderText(self._t("ph_select_file", key=key))
-        self.firmware_folder_edit.setPlaceholderText(self._t("ph_fw_folder"))
-        self.device_path_edit.setPlaceholderText(self._t("ph_device_path"))
-        self.command_preview.setPlaceholderText(self._t("ph_command_preview"))
-
-        self.prefer_home_csc.setText(self._t("chk_prefer_home_csc"))
-        self.opt_nand_erase.setText(self._t("chk_nand_erase"))
-        self.opt_home_validate.setText(self._t("chk_home_validate"))
-        self.opt_reboot.setText(self._t("chk_reboot"))
-        self.opt_redownload.setText(self._t("chk_redownload"))
-        self.confirm_risk.setText(self._t("chk_confirm_risk"))
-        self.confirm_download.setText(self._t("chk_confirm_download"))
-
-        self.copy_cmd.setText(self._t("btn_copy"))
-        self.flash_button.setText(self._t("btn_flash"))
-        self.stop_button.setText(self._t("btn_stop"))
-        self.refresh_devices.setText(self._t("btn_refresh"))
-        self.browse_odin.setText(self._t("btn_browse"))
-        self.detect_odin.setText(self._t("btn_auto_detect"))
-        self.browse_folder.setText(self._t("btn_browse"))
-        self.scan_folder.setText(self._t("btn_scan"))
-
-        for key in FILE_KEYS:
-            self.file_browse_buttons[key].setText(self._t("btn_browse"))
-            self.file_clear_buttons[key].setText(self._t("btn_clear"))
-
-        if self.device_combo.count() > 0:
-            self.device_combo.setItemText(0, self._t("combo_auto_device"))
+        self._retranslate_widgets()
+        self._retranslate_dynamic()
 
-        self.adb_group.setTitle(self._t("group_adb"))
-        self.adb_devices_group.setTitle(self._t("group_adb_devices"))
-        self.adb_actions_group.setTitle(self._t("group_quick_actions"))
-        self.adb_file_group.setTitle(self._t("group_file_ops"))
-        self.adb_shell_group.setTitle(self._t("group_adb_shell"))
-
-        self.adb_path_edit.setPlaceholderText(self._t("ph_adb_path"))
-        self.adb_push_local.setPlaceholderText(self._t("ph_adb_push_local"))
-        self.adb_pull_remote.setPlaceholderText(self._t("ph_adb_pull_remote"))
-        self.adb_pull_local.setPlaceholderText(self._t("ph_adb_pull_local"))
-        self.adb_install_apk.setPlaceholderText(self._t("ph_adb_install_apk"))
-        self.adb_shell_cmd.setPlaceholderText(self._t("ph_adb_shell_cmd"))
-
-        self.browse_adb.setText(self._t("btn_browse"))
-        self.detect_adb.setText(self._t("btn_auto_detect"))
-        self.refresh_adb.setText(self._t("btn_refresh"))
-        self.reboot_download.setText(self._t("btn_reboot_download"))
-        self.reboot_recovery.setText(self._t("btn_reboot_recovery"))
-        self.reboot_system.setText(self._t("btn_reboot_system"))
-        self.kill_server.setText(self._t("btn_kill_adb"))
-        self.start_server.setText(self._t("btn_start_adb"))
-        self.push_btn.setText(self._t("btn_push"))
-        self.pull_btn.setText(self._t("btn_pull"))
-        self.install_btn.setText(self._t("btn_install_apk"))
-        self.shell_run.setText(self._t("btn_run"))
-        self.push_browse.setText(self._t("btn_browse"))
-        self.pull_browse.setText(self._t("btn_browse"))
-        self.install_browse.setText(self._t("btn_browse"))
-
-        if self.adb_device_combo.count() > 0:
-            self.adb_device_combo.setItemText(0, self._t("combo_all_devices"))
-        if self.adb_devices_view.toPlainText().strip() == STRINGS["en"]["no_devices"] or \
-                self.adb_devices_view.toPlainText().strip() == STRINGS["ru"]["no_devices"]:
-            self.adb_devices_view.setPlainText(self._t("no_devices"))
-
-        self.profile_group.setTitle(self._t("group_profiles"))
-        self.load_folder.setText(self._t("btn_load_folder"))
-        self.apply_profile.setText(self._t("btn_apply_profile"))
-        self.flash_profile.setText(self._t("btn_flash_stock"))
-        self.open_profiles.setText(self._t("btn_open_profiles"))
-        if self.profile_combo.count() > 0:
-            self.profile_combo.setItemText(0, self._t("combo_no_profile"))
-
-        if self._current_profile() is None:
-            self.profile_details.setPlainText(self._t("profile_none"))
-        else:
-            self._profile_changed()
-
-        self.log_group.setTitle(self._t("group_logs"))
-        self.save_log.setText(self._t("btn_save_log"))
-        self.clear_log.setText(self._t("btn_clear_log"))
-
-        self.settings_group.setTitle(self._t("group_settings"))
-        self.setting_autoscroll.setText(self._t("chk_autoscroll"))
-        self.setting_timestamp.setText(self._t("chk_timestamp"))
-        self.theme_label.setText(self._t("lbl_theme"))
-        self.lang_label.setText(self._t("lbl_language"))
-        if self.theme_combo.count() >= 2:
+    def _retranslate_dynamic(self) -> None:
+        if "flash" in self.pages and self.device_combo.count() > 0:
+            self.device_combo.setItemText(0, self._t("combo_auto_device"))
+        if "adb" in self.pages:
+            if self.adb_device_combo.count() > 0:
+                self.adb_device_combo.setItemText(0, self._t("combo_all_devices"))
+            if self.adb_devices_view.toPlainText().strip() == _strings_for("en")["no_devices"] or \
+                    self.adb_devices_view.toPlainText().strip() == _strings_for("ru")["no_devices"]:
+                self.adb_devices_view.setPlainText(self._t("no_devices"))
+        if "profiles" in self.pages:
+            if self.profile_combo.count() > 0:
+                self.profile_combo.setItemText(0, self._t("combo_no_profile"))
+            if self._current_profile() is None:
+                self.profile_details.setPlainText(self._t("profile_none"))
+            else:
+                self._profile_changed()
+        if "settings" in self.pages and self.theme_combo.count() >= 2:
             self.theme_combo.setItemText(0, self._t("theme_custom"))
             self.theme_combo.setItemText(1, self._t("theme_qt"))
-        if self.lang_combo.count() >= 2:
+        if "settings" in self.pages and self.lang_combo.count() >= 2:
             self.lang_combo.setItemText(0, self._t("lang_ru"))
             self.lang_combo.setItemText(1, self._t("lang_en"))
 
@@ -607,119 +781,134 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self.device_status_label.setText(self._t("device_found", count=count))
 
+    @QtCore.Slot(QtWidgets.QAbstractButton)
     def _switch_page(self, button: QtWidgets.QAbstractButton) -> None:
         for key, btn in self.nav_buttons.items():
             if btn is button:
-                self.stack.setCurrentWidget(self.pages[key])
+                self.stack.setCurrentWidget(self._ensure_page(key))
+                if key == "logs":
+                    self._refresh_log_view_if_stale()
                 break
 
+    def _refresh_log_view_if_stale(self) -> None:
+        if not self._log_view_stale:
+            return
+        self._log_view_stale = False
+        self._log_pending.clear()
+        self.log_view.setPlainText(
+            self._log_buffer.decode("utf-8", errors="replace").rstrip("\n")
+        )
+        if self._autoscroll_enabled():
+            scrollbar = self.log_view.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _make_button(self, text_key: str, slot=None, object_name: str = "") -> QtWidgets.QPushButton:
+        button = QtWidgets.QPushButton()
+        self._tr(button, text_key)
+        if object_name:
+            button.setObjectName(object_name)
+        if slot is not None:
+            button.clicked.connect(slot)
+        return button
+
+    def _make_edit(self, placeholder_key: str, slot=None, **kwargs) -> QtWidgets.QLineEdit:
+        edit = QtWidgets.QLineEdit()
+        self._tr(edit, placeholder_key, "placeholder", **kwargs)
+        if slot is not None:
+            edit.textChanged.connect(slot)
+        return edit
+
+    def _make_checkbox(self, text_key: str, slot=None) -> QtWidgets.QCheckBox:
+        checkbox = QtWidgets.QCheckBox()
+        self._tr(checkbox, text_key)
+        if slot is not None:
+            checkbox.stateChanged.connect(slot)
+        return checkbox
+
+    def _make_group(self, title_key: str, layout_cls=QtWidgets.QGridLayout):
+        group = QtWidgets.QGroupBox()
+        self._tr(group, title_key, "title")
+        return group, layout_cls(group)
+
     def _build_flash_page(self) -> QtWidgets.QWidget:
         page = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(page)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
 
-        self.odin_group = QtWidgets.QGroupBox()
-        odin_layout = QtWidgets.QHBoxLayout(self.odin_group)
-        self.odin_path_edit = QtWidgets.QLineEdit()
-        self.odin_path_edit.textChanged.connect(self._refresh_command_preview)
-        self.odin_path_edit.textChanged.connect(self._update_flash_ready)
-        self.browse_odin = QtWidgets.QPushButton()
-        self.browse_odin.clicked.connect(self._select_odin_path)
-        self.detect_odin = QtWidgets.QPushButton()
-        self.detect_odin.clicked.connect(self._auto_detect_odin)
+        self.odin_group, odin_layout = self._make_group("group_odin", QtWidgets.QHBoxLayout)
+        self.odin_path_edit = self._make_edit("ph_odin_path", self._schedule_refresh)
+        self.odin_path_edit.textChanged.connect(self._invalidate_path_cache)
+        self.odin_path_edit.editingFinished.connect(self._update_odin_path_ok)
+        self.browse_odin = self._make_button("btn_browse", self._select_odin_path)
+        self.detect_odin = self._make_button("btn_auto_detect", self._auto_detect_odin)
         odin_layout.addWidget(self.odin_path_edit, 1)
         odin_layout.addWidget(self.browse_odin)
         odin_layout.addWidget(self.detect_odin)
 
-        self.files_group = QtWidgets.QGroupBox()
-        files_layout = QtWidgets.QGridLayout(self.files_group)
+        self.files_group, files_layout = self._make_group("group_firmware")
         files_layout.setHorizontalSpacing(10)
         files_layout.setVerticalSpacing(10)
 
         self.file_edits: Dict[str, QtWidgets.QLineEdit] = {}
         self.file_browse_buttons: Dict[str, QtWidgets.QPushButton] = {}
         self.file_clear_buttons: Dict[str, QtWidgets.QPushButton] = {}
-        row = 0
-        for key in FILE_KEYS:
-            label = QtWidgets.QLabel(key)
-            edit = QtWidgets.QLineEdit()
-            edit.textChanged.connect(self._refresh_command_preview)
-            edit.textChanged.connect(self._update_flash_ready)
-            browse = QtWidgets.QPushButton()
-            browse.clicked.connect(lambda _checked=False, k=key: self._select_file(k))
-            clear = QtWidgets.QPushButton()
-            clear.clicked.connect(lambda _checked=False, k=key: self._clear_file(k))
-            files_layout.addWidget(label, row, 0)
+        for row, key in enumerate(FILE_KEYS):
+            edit = self._make_edit("ph_select_file", self._schedule_refresh, key=key)
+            browse = self._make_button(
+                "btn_browse", lambda _checked=False, k=key: self._select_file(k)
+            )
+            clear = self._make_button(
+                "btn_clear", lambda _checked=False, k=key: self._clear_file(k)
+            )
+            files_layout.addWidget(QtWidgets.QLabel(key), row, 0)
             files_layout.addWidget(edit, row, 1)
             files_layout.addWidget(browse, row, 2)
             files_layout.addWidget(clear, row, 3)
             self.file_edits[key] = edit
             self.file_browse_buttons[key] = browse
             self.file_clear_buttons[key] = clear
-            row += 1
-
-        self.detect_group = QtWidgets.QGroupBox()
-        detect_layout = QtWidgets.QGridLayout(self.detect_group)
-        self.firmware_folder_edit = QtWidgets.QLineEdit()
-        self.browse_folder = QtWidgets.QPushButton()
-        self.browse_folder.clicked.connect(self._select_firmware_folder)
-        self.scan_folder = QtWidgets.QPushButton()
-        self.scan_folder.clicked.connect(self._scan_firmware_folder)
-        self.prefer_home_csc = QtWidgets.QCheckBox()
-        self.prefer_home_csc.stateChanged.connect(self._update_flash_ready)
+        self._file_edit_pairs = tuple(self.file_edits.items())
+
+        self.detect_group, detect_layout = self._make_group("group_auto_detect")
+        self.firmware_folder_edit = self._make_edit("ph_fw_folder")
+        self.browse_folder = self._make_button("btn_browse", self._select_firmware_folder)
+        self.scan_folder = self._make_button("btn_scan", self._scan_firmware_folder)
+        self.prefer_home_csc = self._make_checkbox("chk_prefer_home_csc", self._schedule_refresh)
         detect_layout.addWidget(self.firmware_folder_edit, 0, 0, 1, 2)
         detect_layout.addWidget(self.browse_folder, 0, 2)
         detect_layout.addWidget(self.scan_folder, 0, 3)
         detect_layout.addWidget(self.prefer_home_csc, 1, 0, 1, 2)
 
-        self.device_group = QtWidgets.QGroupBox()
-        device_layout = QtWidgets.QGridLayout(self.device_group)
+        self.device_group, device_layout = self._make_group("group_device")
         self.device_combo = QtWidgets.QComboBox()
         self.device_combo.addItem("")
-        self.device_combo.currentIndexChanged.connect(self._refresh_command_preview)
-        self.refresh_devices = QtWidgets.QPushButton()
-        self.refresh_devices.clicked.connect(self._refresh_odin_devices)
-        self.device_path_edit = QtWidgets.QLineEdit()
-        self.device_path_edit.textChanged.connect(self._refresh_command_preview)
+        self.device_combo.currentIndexChanged.connect(self._schedule_refresh)
+        self.refresh_devices = self._make_button("btn_refresh", self._refresh_odin_devices)
+        self.device_path_edit = self._make_edit("ph_device_path", self._schedule_refresh)
         device_layout.addWidget(self.device_combo, 0, 0)
         device_layout.addWidget(self.refresh_devices, 0, 1)
         device_layout.addWidget(self.device_path_edit, 1, 0, 1, 2)
 
-        self.options_group = QtWidgets.QGroupBox()
-        options_layout = QtWidgets.QGridLayout(self.options_group)
-        self.opt_nand_erase = QtWidgets.QCheckBox()
-        self.opt_home_validate = QtWidgets.QCheckBox()
-        self.opt_reboot = QtWidgets.QCheckBox()
-        self.opt_redownload = QtWidgets.QCheckBox()
-        for checkbox in [
-            self.opt_nand_erase,
-            self.opt_home_validate,
-            self.opt_reboot,
-            self.opt_redownload,
+        self.options_group, options_layout = self._make_group("group_options")
+        for attr, key, row, col in [
+            ("opt_nand_erase", "chk_nand_erase", 0, 0),
+            ("opt_home_validate", "chk_home_validate", 0, 1),
+            ("opt_reboot", "chk_reboot", 1, 0),
+            ("opt_redownload", "chk_redownload", 1, 1),
         ]:
-            checkbox.stateChanged.connect(self._refresh_command_preview)
-        options_layout.addWidget(self.opt_nand_erase, 0, 0)
-        options_layout.addWidget(self.opt_home_validate, 0, 1)
-        options_layout.addWidget(self.opt_reboot, 1, 0)
-        options_layout.addWidget(self.opt_redownload, 1, 1)
-
-        self.action_group = QtWidgets.QGroupBox()
-        action_layout = QtWidgets.QGridLayout(self.action_group)
-        self.confirm_risk = QtWidgets.QCheckBox()
-        self.confirm_download = QtWidgets.QCheckBox()
-        self.confirm_risk.stateChanged.connect(self._update_flash_ready)
-        self.confirm_download.stateChanged.connect(self._update_flash_ready)
-        self.command_preview = QtWidgets.QLineEdit()
+            checkbox = self._make_checkbox(key, self._schedule_refresh)
+            setattr(self, attr, checkbox)
+            options_layout.addWidget(checkbox, row, col)
+
+        self.action_group, action_layout = self._make_group("group_actions")
+        self.confirm_risk = self._make_checkbox("chk_confirm_risk", self._schedule_refresh)
+        self.confirm_download = self._make_checkbox("chk_confirm_download", self._schedule_refresh)
+        self.command_preview = self._make_edit("ph_command_preview")
         self.command_preview.setReadOnly(True)
-        self.copy_cmd = QtWidgets.QPushButton()
-        self.copy_cmd.clicked.connect(self._copy_command)
-        self.flash_button = QtWidgets.QPushButton()
-        self.flash_button.setObjectName("PrimaryButton")
-        self.flash_button.clicked.connect(self._start_flash)
-        self.stop_button = QtWidgets.QPushButton()
-        self.stop_button.setObjectName("DangerButton")
-        self.stop_button.clicked.connect(self._stop_flash)
+        self.copy_cmd = self._make_button("btn_copy", self._copy_command)
+        self.flash_button = self._make_button("btn_flash", self._start_flash, "PrimaryButton")
+        self.stop_button = self._make_button("btn_stop", self._stop_flash, "DangerButton")
         self.stop_button.setEnabled(False)
 
         action_layout.addWidget(self.confirm_risk, 0, 0)
@@ -751,21 +940,28 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.setSpacing(16)
 
         self.adb_group = QtWidgets.QGroupBox()
+        self._tr(self.adb_group, "group_adb", "title")
         adb_layout = QtWidgets.QHBoxLayout(self.adb_group)
         self.adb_path_edit = QtWidgets.QLineEdit()
+        self._tr(self.adb_path_edit, "ph_adb_path", "placeholder")
+        self.adb_path_edit.textChanged.connect(self._invalidate_path_cache)
         self.browse_adb = QtWidgets.QPushButton()
+        self._tr(self.browse_adb, "btn_browse")
         self.browse_adb.clicked.connect(self._select_adb_path)
         self.detect_adb = QtWidgets.QPushButton()
+        self._tr(self.detect_adb, "btn_auto_detect")
         self.detect_adb.clicked.connect(self._auto_detect_adb)
         adb_layout.addWidget(self.adb_path_edit, 1)
         adb_layout.addWidget(self.browse_adb)
         adb_layout.addWidget(self.detect_adb)
 
         self.adb_devices_group = QtWidgets.QGroupBox()
+        self._tr(self.adb_devices_group, "group_adb_devices", "title")
         device_layout = QtWidgets.QGridLayout(self.adb_devices_group)
         self.adb_device_combo = QtWidgets.QComboBox()
         self.adb_device_combo.addItem("")
         self.refresh_adb = QtWidgets.QPushButton()
+        self._tr(self.refresh_adb, "btn_refresh")
         self.refresh_adb.clicked.connect(self._refresh_adb_devices)
         self.adb_devices_view = QtWidgets.QPlainTextEdit()
         self.adb_devices_view.setReadOnly(True)
@@ -774,17 +970,23 @@ class MainWindow(QtWidgets.QMainWindow):
         device_layout.addWidget(self.adb_devices_view, 1, 0, 1, 2)
 
         self.adb_actions_group = QtWidgets.QGroupBox()
+        self._tr(self.adb_actions_group, "group_quick_actions", "title")
         actions_layout = QtWidgets.QGridLayout(self.adb_actions_group)
         self.reboot_download = QtWidgets.QPushButton()
+        self._tr(self.reboot_download, "btn_reboot_download")
         self.reboot_recovery = QtWidgets.QPushButton()
+        self._tr(self.reboot_recovery, "btn_reboot_recovery")
         self.reboot_system = QtWidgets.QPushButton()
+        self._tr(self.reboot_system, "btn_reboot_system")
         self.kill_server = QtWidgets.QPushButton()
+        self._tr(self.kill_server, "btn_kill_adb")
         self.start_server = QtWidgets.QPushButton()
-        self.reboot_download.clicked.connect(lambda: self._adb_command(["reboot", "download"]))
-        self.reboot_recovery.clicked.connect(lambda: self._adb_command(["reboot", "recovery"]))
-        self.reboot_system.clicked.connect(lambda: self._adb_command(["reboot"]))
-        self.kill_server.clicked.connect(lambda: self._adb_command(["kill-server"]))
-        self.start_server.clicked.connect(lambda: self._adb_command(["start-server"]))
+        self._tr(self.start_server, "btn_start_adb")
+        self.reboot_download.clicked.connect(self._do_reboot_download)
+        self.reboot_recovery.clicked.connect(self._do_reboot_recovery)
+        self.reboot_system.clicked.connect(self._do_reboot_system)
+        self.kill_server.clicked.connect(self._do_kill_server)
+        self.start_server.clicked.connect(self._do_start_server)
         actions_layout.addWidget(self.reboot_download, 0, 0)
         actions_layout.addWidget(self.reboot_recovery, 0, 1)
         actions_layout.addWidget(self.reboot_system, 0, 2)
@@ -792,25 +994,36 @@ class MainWindow(QtWidgets.QMainWindow):
         actions_layout.addWidget(self.start_server, 1, 1)
 
         self.adb_file_group = QtWidgets.QGroupBox()
+        self._tr(self.adb_file_group, "group_file_ops", "title")
         file_layout = QtWidgets.QGridLayout(self.adb_file_group)
         self.adb_push_local = QtWidgets.QLineEdit()
+        self._tr(self.adb_push_local, "ph_adb_push_local", "placeholder")
         self.push_browse = QtWidgets.QPushButton()
+        self._tr(self.push_browse, "btn_browse")
         self.push_browse.clicked.connect(self._select_adb_push_file)
         self.adb_push_remote = QtWidgets.QLineEdit("/sdcard/Download/")
         self.push_btn = QtWidgets.QPushButton()
+        self._tr(self.push_btn, "btn_push")
         self.push_btn.clicked.connect(self._adb_push)
 
         self.adb_pull_remote = QtWidgets.QLineEdit()
+        self._tr(self.adb_pull_remote, "ph_adb_pull_remote", "placeholder")
         self.adb_pull_local = QtWidgets.QLineEdit()
+        self._tr(self.adb_pull_local, "ph_adb_pull_local", "placeholder")
         self.pull_browse = QtWidgets.QPushButton()
+        self._tr(self.pull_browse, "btn_browse")
         self.pull_browse.clicked.connect(self._select_adb_pull_folder)
         self.pull_btn = QtWidgets.QPushButton()
+        self._tr(self.pull_btn, "btn_pull")
         self.pull_btn.clicked.connect(self._adb_pull)
 
         self.adb_install_apk = QtWidgets.QLineEdit()
+        self._tr(self.adb_install_apk, "ph_adb_install_apk", "placeholder")
         self.install_browse = QtWidgets.QPushButton()
+        self._tr(self.install_browse, "btn_browse")
         self.install_browse.clicked.connect(self._select_adb_install_apk)
         self.install_btn = QtWidgets.QPushButton()
+        self._tr(self.install_btn, "btn_install_apk")
         self.install_btn.clicked.connect(self._adb_install)
 
         file_layout.addWidget(self.adb_push_local, 0, 0)
@@ -828,9 +1041,12 @@ class MainWindow(QtWidgets.QMainWindow):
         file_layout.addWidget(self.install_btn, 2, 2)
 
         self.adb_shell_group = QtWidgets.QGroupBox()
+        self._tr(self.adb_shell_group, "group_adb_shell", "title")
         shell_layout = QtWidgets.QHBoxLayout(self.adb_shell_group)
         self.adb_shell_cmd = QtWidgets.QLineEdit()
+        self._tr(self.adb_shell_cmd, "ph_adb_shell_cmd", "placeholder")
         self.shell_run = QtWidgets.QPushButton()
+        self._tr(self.shell_run, "btn_run")
         self.shell_run.clicked.connect(self._adb_shell)
         shell_layout.addWidget(self.adb_shell_cmd, 1)
         shell_layout.addWidget(self.shell_run)
@@ -851,22 +1067,30 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.setSpacing(16)
 
         self.profile_group = QtWidgets.QGroupBox()
+        self._tr(self.profile_group, "group_profiles", "title")
         profile_layout = QtWidgets.QGridLayout(self.profile_group)
         self.profile_combo = QtWidgets.QComboBox()
         self.profile_combo.addItem("")
         for profile in self.profiles:
             self.profile_combo.addItem(profile.name, profile.profile_id)
+        self._profile_index_by_id = {
+            profile.profile_id: idx + 1 for idx, profile in enumerate(self.profiles)
+        }
         self.profile_combo.currentIndexChanged.connect(self._profile_changed)
         self.profile_details = QtWidgets.QPlainTextEdit()
         self.profile_details.setReadOnly(True)
         self.load_folder = QtWidgets.QPushButton()
+        self._tr(self.load_folder, "btn_load_folder")
         self.load_folder.clicked.connect(self._profile_load_folder)
         self.apply_profile = QtWidgets.QPushButton()
+        self._tr(self.apply_profile, "btn_apply_profile")
         self.apply_profile.clicked.connect(self._profile_apply)
         self.flash_profile = QtWidgets.QPushButton()
+        self._tr(self.flash_profile, "btn_flash_stock")
         self.flash_profile.setObjectName("PrimaryButton")
         self.flash_profile.clicked.connect(self._profile_flash)
         self.open_profiles = QtWidgets.QPushButton()
+        self._tr(self.open_profiles, "btn_open_profiles")
         self.open_profiles.clicked.connect(self._open_profiles_file)
 
         profile_layout.addWidget(self.profile_combo, 0, 0, 1, 2)
@@ -888,16 +1112,23 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.setSpacing(16)
 
         self.log_group = QtWidgets.QGroupBox()
+        self._tr(self.log_group, "group_logs", "title")
         log_layout = QtWidgets.QVBoxLayout(self.log_group)
         self.log_view = QtWidgets.QPlainTextEdit()
         self.log_view.setReadOnly(True)
         self.log_view.setMaximumBlockCount(5000)
+        if self._log_buffer:
+            self.log_view.setPlainText(
+                self._log_buffer.decode("utf-8", errors="replace").rstrip("\n")
+            )
         log_layout.addWidget(self.log_view)
 
         action_layout = QtWidgets.QHBoxLayout()
         self.save_log = QtWidgets.QPushButton()
+        self._tr(self.save_log, "btn_save_log")
         self.save_log.clicked.connect(self._save_log)
         self.clear_log = QtWidgets.QPushButton()
+        self._tr(self.clear_log, "btn_clear_log")
         self.clear_log.clicked.connect(self._clear_log)
         action_layout.addWidget(self.save_log)
         action_layout.addWidget(self.clear_log)
@@ -916,28 +1147,39 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.setSpacing(16)
 
         self.settings_group = QtWidgets.QGroupBox()
+        self._tr(self.settings_group, "group_settings", "title")
         settings_layout = QtWidgets.QVBoxLayout(self.settings_group)
-        self.setting_autoscroll = QtWidgets.QCheckBox("Auto-scroll logs")
+        self.setting_autoscroll = QtWidgets.QCheckBox()
+        self._tr(self.setting_autoscroll, "chk_autoscroll")
         self.setting_autoscroll.setChecked(True)
-        self.setting_timestamp = QtWidgets.QCheckBox("Timestamps in logs")
+        self.setting_timestamp = QtWidgets.QCheckBox()
+        self._tr(self.setting_timestamp, "chk_timestamp")
         self.setting_timestamp.setChecked(True)
         settings_layout.addWidget(self.setting_autoscroll)
         settings_layout.addWidget(self.setting_timestamp)
 
         theme_layout = QtWidgets.QGridLayout()
         self.theme_label = QtWidgets.QLabel()
+        self._tr(self.theme_label, "lbl_theme")
         self.theme_combo = QtWidgets.QComboBox()
         self.theme_combo.addItem("Odin VST", "custom")
         self.theme_combo.addItem("Qt Default", "qt")
+        self._theme_index_by_data = {
+            self.theme_combo.itemData(idx): idx for idx in range(self.theme_combo.count())
+        }
         self.theme_combo.currentIndexChanged.connect(self._apply_theme)
         theme_layout.addWidget(self.theme_label, 0, 0)
         theme_layout.addWidget(self.theme_combo, 0, 1)
 
         lang_layout = QtWidgets.QGridLayout()
         self.lang_label = QtWidgets.QLabel()
+        self._tr(self.lang_label, "lbl_language")
         self.lang_combo = QtWidgets.QComboBox()
         self.lang_combo.addItem("Русский", "ru")
         self.lang_combo.addItem("English", "en")
+        self._lang_index_by_data = {
+            self.lang_combo.itemData(idx): idx for idx in range(self.lang_combo.count())
+        }
         self.lang_combo.currentIndexChanged.connect(self._apply_language)
         lang_layout.addWidget(self.lang_label, 0, 0)
         lang_layout.addWidget(self.lang_combo, 0, 1)
@@ -950,81 +1192,162 @@ class MainWindow(QtWidgets.QMainWindow):
         return page
 
     def _apply_settings(self) -> None:
-        self.odin_path_edit.setText(self.settings.get("odin_path", _default_odin_path()))
-        self.adb_path_edit.setText(self.settings.get("adb_path", _default_adb_path()))
-        files = self.settings.get("files", {})
-        for key, edit in self.file_edits.items():
-            edit.setText(files.get(key, ""))
-        flags = self.settings.get("flags", {})
-        self.opt_nand_erase.setChecked(bool(flags.get("nand_erase", False)))
-        self.opt_home_validate.setChecked(bool(flags.get("home_validate", False)))
-        self.opt_reboot.setChecked(bool(flags.get("reboot", True)))
-        self.opt_redownload.setChecked(bool(flags.get("redownload", False)))
-        self.device_path_edit.setText(self.settings.get("device_path", ""))
-        self.prefer_home_csc.setChecked(bool(self.settings.get("prefer_home_csc", True)))
-        self.setting_autoscroll.setChecked(bool(self.settings.get("auto_scroll", True)))
-        self.setting_timestamp.setChecked(bool(self.settings.get("timestamp", True)))
-        theme = self.settings.get("theme", self.current_theme)
-        lang = self.settings.get("language", self.current_language)
-        if theme:
-            for idx in range(self.theme_combo.count()):
-                if self.theme_combo.itemData(idx) == theme:
-                    self.theme_combo.setCurrentIndex(idx)
-                    break
-        if lang:
-            for idx in range(self.lang_combo.count()):
-                if self.lang_combo.itemData(idx) == lang:
-                    self.lang_combo.setCurrentIndex(idx)
-                    break
-        last_profile = self.settings.get("last_profile_id", "")
-        if last_profile:
-            for idx in range(1, self.profile_combo.count()):
-                if self.profile_combo.itemData(idx) == last_profile:
-                    self.profile_combo.setCurrentIndex(idx)
-                    break
+        for key in self.pages:
+            self._apply_page_settings(key)
+
+    def _apply_page_settings(self, page_key: str) -> None:
+        if page_key == "flash":
+            blockers = [
+                QtCore.QSignalBlocker(widget)
+                for widget in (
+                    self.odin_path_edit,
+                    *self.file_edits.values(),
+                    self.opt_nand_erase,
+                    self.opt_home_validate,
+                    self.opt_reboot,
+                    self.opt_redownload,
+                    self.device_path_edit,
+                    self.prefer_home_csc,
+                )
+            ]
+            self.odin_path_edit.setText(self.settings.get("odin_path", _default_odin_path()))
+            files = self.settings.get("files", {})
+            for key, edit in self.file_edits.items():
+                edit.setText(files.get(key, ""))
+            flags = self.settings.get("flags", {})
+            for key, default in SETTINGS_FLAG_DEFAULTS:
+                getattr(self, f"opt_{key}").setChecked(bool(flags.get(key, default)))
+            self.device_path_edit.setText(self.settings.get("device_path", ""))
+            self.prefer_home_csc.setChecked(bool(self.settings.get("prefer_home_csc", True)))
+            del blockers
+            self._refresh_command_preview()
+            self._update_odin_path_ok()
+        elif page_key == "adb":
+            self.adb_path_edit.setText(self.settings.get("adb_path", _default_adb_path()))
+        elif page_key == "profiles":
+            last_profile = self.settings.get("last_profile_id", "")
+            idx = self._profile_index_by_id.get(last_profile)
+            if idx:
+                blocker = QtCore.QSignalBlocker(self.profile_combo)
+                self.profile_combo.setCurrentIndex(idx)
+                del blocker
+                self._profile_changed()
+        elif page_key == "settings":
+            blockers = [
+                QtCore.QSignalBlocker(widget)
+                for widget in (self.theme_combo, self.lang_combo)
+            ]
+            self.setting_autoscroll.setChecked(bool(self.settings.get("auto_scroll", True)))
+            self.setting_timestamp.setChecked(bool(self.settings.get("timestamp", True)))
+            theme = self.settings.get("theme", self.current_theme)
+            lang = self.settings.get("language", self.current_language)
+            theme_idx = self._theme_index_by_data.get(theme)
+            if theme_idx is not None:
+                self.theme_combo.setCurrentIndex(theme_idx)
+            lang_idx = self._lang_index_by_data.get(lang)
+            if lang_idx is not None:
+                self.lang_combo.setCurrentIndex(lang_idx)
+            del blockers
+            self._apply_theme()
+            self._apply_language()
 
     def _collect_settings(self) -> Dict:
-        return {
-            "odin_path": self.odin_path_edit.text().strip(),
-            "adb_path": self.adb_path_edit.text().strip(),
-            "files": {key: edit.text().strip() for key, edit in self.file_edits.items()},
-            "flags": {
-                "nand_erase": self.opt_nand_erase.isChecked(),
-                "home_validate": self.opt_home_validate.isChecked(),
-                "reboot": self.opt_reboot.isChecked(),
-                "redownload": self.opt_redownload.isChecked(),
-            },
-            "device_path": self.device_path_edit.text().strip(),
-            "prefer_home_csc": self.prefer_home_csc.isChecked(),
-            "auto_scroll": self.setting_autoscroll.isChecked(),
-            "timestamp": self.setting_timestamp.isChecked(),
-            "theme": self.theme_combo.currentData(),
-            "language": self.lang_combo.currentData(),
-            "last_profile_id": self.profile_combo.itemData(self.profile_combo.currentIndex()) or "",
-        }
+        settings = dict(self.settings)
+        settings["theme"] = self.current_theme
+        settings["language"] = self.current_language
+        if "flash" in self.pages:
+            settings["odin_path"] = self.odin_path_edit.text().strip()
+            settings["files"] = {key: edit.text().strip() for key, edit in self._file_edit_pairs}
+            settings["flags"] = {
+                key: getattr(self, f"opt_{key}").isChecked()
+                for key, _default in SETTINGS_FLAG_DEFAULTS
+            }
+            settings["device_path"] = self.device_path_edit.text().strip()
+            settings["prefer_home_csc"] = self.prefer_home_csc.isChecked()
+        if "adb" in self.pages:
+            settings["adb_path"] = self.adb_path_edit.text().strip()
+        if "profiles" in self.pages:
+            settings["last_profile_id"] = (
+                self.profile_combo.itemData(self.profile_combo.currentIndex()) or ""
+            )
+        if "settings" in self.pages:
+            settings["auto_scroll"] = self.setting_autoscroll.isChecked()
+            settings["timestamp"] = self.setting_timestamp.isChecked()
+        return settings
 
-    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+    def closeEvent(self, event: "QtGui.QCloseEvent") -> None:
         save_settings(self._collect_settings())
         return super().closeEvent(event)
 
+    def _path_exists(self, path: str) -> bool:
+        cached = self._path_exists_cache.get(path)
+        if cached is None:
+            cached = Path(path).exists()
+            self._path_exists_cache[path] = cached
+        return cached
+
+    @QtCore.Slot(str)
+    def _invalidate_path_cache(self, path: str) -> None:
+        self._path_exists_cache.pop(path, None)
+
+    def _timestamps_enabled(self) -> bool:
+        if "settings" in self.pages:
+            return self.setting_timestamp.isChecked()
+        return bool(self.settings.get("timestamp", True))
+
+    def _autoscroll_enabled(self) -> bool:
+        if "settings" in self.pages:
+            return self.setting_autoscroll.isChecked()
+        return bool(self.settings.get("auto_scroll", True))
+
+    def _timestamp(self) -> str:
+        now = int(time.time())
+        if now != self._timestamp_cache[0]:
+            self._timestamp_cache = (now, datetime.now().strftime("%H:%M:%S"))
+        return self._timestamp_cache[1]
+
     def _log(self, message: str) -> None:
         if not message:
             return
         timestamped = message
-        if self.setting_timestamp.isChecked():
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            timestamped = f"[{timestamp}] {message}"
-        self.log_lines.append(timestamped)
-        if len(self.log_lines) > 5000:
-            self.log_lines = self.log_lines[-5000:]
-        self.log_view.appendPlainText(timestamped)
-        if self.setting_autoscroll.isChecked():
-            self.log_view.verticalScrollBar().setValue(self.log_view.verticalScrollBar().maximum())
-
+        if self._timestamps_enabled():
+            timestamped = f"[{self._timestamp()}] {message}"
+        self._log_buffer += timestamped.encode("utf-8", errors="replace") + b"\n"
+        if len(self._log_buffer) > LOG_BUFFER_CAP:
+            cut = self._log_buffer.find(b"\n", len(self._log_buffer) - LOG_BUFFER_CAP)
+            del self._log_buffer[: cut + 1]
+        if "logs" not in self.pages:
+            return
+        if not self.log_view.isVisible():
+            self._log_view_stale = True
+            return
+        self._log_pending.append(timestamped)
+        if len(self._log_pending) > 5000:
+            del self._log_pending[:-5000]
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @QtCore.Slot()
+    def _flush_log(self) -> None:
+        if not self._log_pending:
+            return
+        batch = "\n".join(self._log_pending)
+        self._log_pending.clear()
+        self.log_view.appendPlainText(batch)
+        if self._autoscroll_enabled():
+            scrollbar = self.log_view.verticalScrollBar()
+            maximum = scrollbar.maximum()
+            if scrollbar.value() != maximum:
+                scrollbar.setValue(maximum)
+
+    @QtCore.Slot()
     def _clear_log(self) -> None:
-        self.log_lines = []
+        self._log_buffer.clear()
+        self._log_pending.clear()
+        self._log_view_stale = False
         self.log_view.clear()
 
+    @QtCore.Slot()
     def _save_log(self) -> None:
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self, self._t("dlg_save_log"), str(APP_DIR / "odin4_gui.log")
@@ -1032,20 +1355,22 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as handle:
-                handle.write("\n".join(self.log_lines))
+            Path(path).write_bytes(self._log_buffer)
             self._log(f"Log saved to {path}")
         except OSError as exc:
             self._log(f"Failed to save log: {exc}")
 
+    @QtCore.Slot()
     def _select_odin_path(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, self._t("dlg_select_odin"), str(ROOT_DIR)
         )
         if path:
             self.odin_path_edit.setText(path)
+            self._update_odin_path_ok()
             self._refresh_command_preview()
 
+    @QtCore.Slot()
     def _auto_detect_odin(self) -> None:
         candidate = Path(_default_odin_path())
         if candidate.exists():
@@ -1053,8 +1378,10 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log(f"Detected odin4 at {candidate}")
         else:
             self._log("odin4 not found in parent folder")
+        self._update_odin_path_ok()
         self._refresh_command_preview()
 
+    @QtCore.Slot()
     def _select_adb_path(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, self._t("dlg_select_adb"), str(ROOT_DIR)
@@ -1062,6 +1389,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if path:
             self.adb_path_edit.setText(path)
 
+    @QtCore.Slot()
     def _auto_detect_adb(self) -> None:
         adb_path = _default_adb_path()
         if adb_path:
@@ -1082,6 +1410,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.file_edits[key].clear()
         self._refresh_command_preview()
 
+    @QtCore.Slot()
     def _select_firmware_folder(self) -> None:
         folder = QtWidgets.QFileDialog.getExistingDirectory(
             self, self._t("dlg_select_folder"), str(ROOT_DIR)
@@ -1089,6 +1418,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if folder:
             self.firmware_folder_edit.setText(folder)
 
+    @QtCore.Slot()
     def _scan_firmware_folder(self) -> None:
         folder_text = self.firmware_folder_edit.text().strip()
         if not folder_text:
@@ -1098,14 +1428,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not folder.exists():
             self._log("Firmware folder does not exist")
             return
-        patterns = {
-            "BL": "BL_*.tar.md5",
-            "AP": "AP_*.tar.md5",
-            "CP": "CP_*.tar.md5",
-            "CSC": "CSC_*.tar.md5",
-            "HOME_CSC": "HOME_CSC_*.tar.md5",
-        }
-        results = detect_firmware(folder, patterns, self.prefer_home_csc.isChecked())
+        results = detect_firmware(folder, DEFAULT_FW_PATTERNS, self.prefer_home_csc.isChecked())
         found_any = False
         for key, path in results.items():
             if path:
@@ -1117,62 +1440,79 @@ class MainWindow(QtWidgets.QMainWindow):
             self._log("No firmware files matched the patterns")
         self._refresh_command_preview()
 
+    @QtCore.Slot()
     def _refresh_odin_devices(self) -> None:
         odin_path = self.odin_path_edit.text().strip()
         if not odin_path:
             self._log("Set odin4 path first")
             return
-        if not Path(odin_path).exists():
+        if not self._path_exists(odin_path):
             self._log("odin4 path does not exist")
             return
-        self._run_process("odin4 -l", odin_path, ["-l"], self._handle_odin_devices)
+        self._start_poll("_odin_devices_proc", odin_path, ["-l"], self._handle_odin_devices)
 
     def _handle_odin_devices(self, stdout: str, stderr: str, exit_code: int) -> None:
         output = (stdout or "").strip()
         if exit_code != 0:
             self._log("odin4 -l failed")
             return
-        lines = [line.strip() for line in output.splitlines() if line.strip()]
+        lines = [line for line in map(str.strip, output.splitlines()) if line]
+        blocker = QtCore.QSignalBlocker(self.device_combo)
         self.device_combo.clear()
         self.device_combo.addItem(self._t("combo_auto_device"))
-        for line in lines:
-            self.device_combo.addItem(line)
+        self.device_combo.addItems(lines)
+        del blocker
+        self._schedule_refresh()
         self._set_device_status(len(lines))
 
+    @QtCore.Slot()
     def _refresh_adb_devices(self) -> None:
         adb_path = self.adb_path_edit.text().strip()
         if not adb_path:
             self._log("Set adb path first")
             return
-        if not Path(adb_path).exists():
+        if not self._path_exists(adb_path):
             self._log("adb path does not exist")
             return
-        self._run_process("adb devices", adb_path, ["devices", "-l"], self._handle_adb_devices)
+        self._start_poll("_adb_devices_proc", adb_path, ["devices", "-l"], self._handle_adb_devices)
 
     def _handle_adb_devices(self, stdout: str, stderr: str, exit_code: int) -> None:
         if exit_code != 0:
             self._log("adb devices failed")
             return
-        lines = stdout.splitlines()
-        devices = []
-        view_lines = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            parts = line.split()
-            serial = parts[0]
-            state = parts[1] if len(parts) > 1 else ""
-            devices.append(serial)
-            view_lines.append(line)
+        devices = [
+            line.split()[0] for line in stdout.splitlines()[1:] if line.strip()
+        ]
+        blocker = QtCore.QSignalBlocker(self.adb_device_combo)
         self.adb_device_combo.clear()
         self.adb_device_combo.addItem(self._t("combo_all_devices"))
-        for serial in devices:
-            self.adb_device_combo.addItem(serial)
-        self.adb_devices_view.setPlainText(
-            "\n".join(view_lines) if view_lines else self._t("no_devices")
-        )
+        self.adb_device_combo.addItems(devices)
+        del blocker
+        header_end = stdout.find("\n")
+        body = stdout[header_end + 1:].strip() if header_end >= 0 else ""
+        self.adb_devices_view.setPlainText(body or self._t("no_devices"))
+
+    @QtCore.Slot()
+    def _do_reboot_download(self) -> None:
+        self._adb_command(self._ADB_REBOOT_DOWNLOAD, detached=True)
+
+    @QtCore.Slot()
+    def _do_reboot_recovery(self) -> None:
+        self._adb_command(self._ADB_REBOOT_RECOVERY, detached=True)
 
-    def _adb_command(self, args: List[str]) -> None:
+    @QtCore.Slot()
+    def _do_reboot_system(self) -> None:
+        self._adb_command(self._ADB_REBOOT_SYSTEM, detached=True)
+
+    @QtCore.Slot()
+    def _do_kill_server(self) -> None:
+        self._adb_command(self._ADB_KILL_SERVER, detached=True)
+
+    @QtCore.Slot()
+    def _do_start_server(self) -> None:
+        self._adb_command(self._ADB_START_SERVER, detached=True)
+
+    def _adb_command(self, args: Sequence[str], detached: bool = False) -> None:
         adb_path = self.adb_path_edit.text().strip()
         if not adb_path:
             self._log("Set adb path first")
@@ -1182,8 +1522,18 @@ class MainWindow(QtWidgets.QMainWindow):
         if device:
             full_args.extend(["-s", device])
         full_args.extend(args)
+        if detached:
+            self._log("adb " + " ".join(full_args))
+            self._run_detached(adb_path, full_args)
+            return
         self._run_process("adb", adb_path, full_args, None)
 
+    def _run_detached(self, program: str, args: List[str]) -> None:
+        started, _pid = QtCore.QProcess.startDetached(program, args, str(ROOT_DIR))
+        if not started:
+            self._log(f"Failed to start {program}")
+
+    @QtCore.Slot()
     def _adb_push(self) -> None:
         local_path = self.adb_push_local.text().strip()
         remote_path = self.adb_push_remote.text().strip()
@@ -1192,6 +1542,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self._adb_command(["push", local_path, remote_path])
 
+    @QtCore.Slot()
     def _adb_pull(self) -> None:
         remote_path = self.adb_pull_remote.text().strip()
         local_path = self.adb_pull_local.text().strip()
@@ -1200,6 +1551,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self._adb_command(["pull", remote_path, local_path])
 
+    @QtCore.Slot()
     def _adb_install(self) -> None:
         apk_path = self.adb_install_apk.text().strip()
         if not apk_path:
@@ -1207,6 +1559,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self._adb_command(["install", "-r", apk_path])
 
+    @QtCore.Slot()
     def _adb_shell(self) -> None:
         cmd = self.adb_shell_cmd.text().strip()
         if not cmd:
@@ -1220,6 +1573,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return None
         return self.adb_device_combo.currentText()
 
+    @QtCore.Slot()
     def _select_adb_push_file(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, self._t("dlg_select_push"), str(ROOT_DIR)
@@ -1227,6 +1581,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if path:
             self.adb_push_local.setText(path)
 
+    @QtCore.Slot()
     def _select_adb_pull_folder(self) -> None:
         folder = QtWidgets.QFileDialog.getExistingDirectory(
             self, self._t("dlg_select_pull_folder"), str(ROOT_DIR)
@@ -1234,6 +1589,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if folder:
             self.adb_pull_local.setText(folder)
 
+    @QtCore.Slot()
     def _select_adb_install_apk(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, self._t("dlg_select_apk"), str(ROOT_DIR), "APK (*.apk)"
@@ -1241,24 +1597,25 @@ class MainWindow(QtWidgets.QMainWindow):
         if path:
             self.adb_install_apk.setText(path)
 
+    @QtCore.Slot()
     def _profile_changed(self) -> None:
         profile = self._current_profile()
         if not profile:
             self.profile_details.setPlainText(self._t("profile_none"))
             return
+        name_lbl, model_lbl, notes_lbl, patterns_lbl, flags_lbl = self._profile_labels
         details = [
-            f"{self._t('profile_name')}: {profile.name}",
-            f"{self._t('profile_model')}: {profile.model}",
-            f"{self._t('profile_notes')}: {profile.notes}",
-            f"{self._t('profile_patterns')}:",
+            f"{name_lbl}: {profile.name}",
+            f"{model_lbl}: {profile.model}",
+            f"{notes_lbl}: {profile.notes}",
+            f"{patterns_lbl}:",
         ]
-        for key, pattern in profile.patterns.items():
-            details.append(f"  {key}: {pattern}")
-        details.append(f"{self._t('profile_flags')}:")
-        for key, value in profile.flags.items():
-            details.append(f"  {key}: {value}")
+        details.extend(f"  {key}: {pattern}" for key, pattern in profile.patterns.items())
+        details.append(f"{flags_lbl}:")
+        details.extend(f"  {key}: {value}" for key, value in profile.flags.items())
         self.profile_details.setPlainText("\n".join(details))
 
+    @QtCore.Slot()
     def _profile_load_folder(self) -> None:
         profile = self._current_profile()
         if not profile:
@@ -1276,6 +1633,7 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self._log("No files matched profile patterns")
 
+    @QtCore.Slot()
     def _profile_apply(self) -> bool:
         profile = self._current_profile()
         if not profile:
@@ -1295,15 +1653,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self._log("Profile applied to flash settings")
         return True
 
+    @QtCore.Slot()
     def _profile_flash(self) -> None:
         if self._profile_apply():
             self._start_flash()
 
+    @QtCore.Slot()
     def _open_profiles_file(self) -> None:
         profiles_path = _profiles_path()
         if not profiles_path.exists():
             self._log("Profiles file not found")
             return
+        from PySide6 import QtGui
+
         QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(profiles_path)))
 
     def _current_profile(self) -> Optional[Profile]:
@@ -1316,6 +1678,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 return profile
         return None
 
+    @QtCore.Slot()
     def _copy_command(self) -> None:
         cmd = self.command_preview.text().strip()
         if not cmd:
@@ -1328,7 +1691,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not odin_path:
             return []
         cmd = [odin_path]
-        for key, flag in [("BL", "-b"), ("AP", "-a"), ("CP", "-c"), ("CSC", "-s"), ("UMS", "-u")]:
+        for key, flag in FILE_FLAGS:
             path = self.file_edits[key].text().strip()
             if path:
                 cmd.extend([flag, path])
@@ -1350,36 +1713,72 @@ class MainWindow(QtWidgets.QMainWindow):
                 cmd.extend(["-d", device_path])
         return cmd
 
+    @QtCore.Slot()
+    def _schedule_refresh(self) -> None:
+        self._refresh_timer.start()
+
+    @QtCore.Slot()
+    def _do_refresh(self) -> None:
+        self._refresh_command_preview()
+        self._update_flash_ready()
+
     def _refresh_command_preview(self) -> None:
         cmd = self._build_odin_command()
+        if cmd == self._preview_cmd:
+            return
+        self._preview_cmd = cmd
         if not cmd:
             self.command_preview.setText("")
             return
-        preview = " ".join(shlex.quote(part) for part in cmd)
+        preview = " ".join(_quote_arg(part) for part in cmd)
         self.command_preview.setText(preview)
 
-    def _update_flash_ready(self) -> None:
-        files_set = any(edit.text().strip() for edit in self.file_edits.values())
+    @QtCore.Slot()
+    def _update_odin_path_ok(self) -> None:
         odin_path = self.odin_path_edit.text().strip()
-        odin_ok = bool(odin_path) and Path(odin_path).exists()
-        ready = files_set and self.confirm_risk.isChecked() and self.confirm_download.isChecked() and odin_ok
+        self._odin_path_ok = bool(odin_path) and self._path_exists(odin_path)
+        self._update_flash_ready()
+
+    def _update_flash_ready(self) -> None:
+        files_set = any(edit.text().strip() for _key, edit in self._file_edit_pairs)
+        ready = (
+            files_set
+            and self.confirm_risk.isChecked()
+            and self.confirm_download.isChecked()
+            and self._odin_path_ok
+        )
         self.flash_button.setEnabled(ready and self.flash_process is None)
 
+    @QtCore.Slot()
     def _start_flash(self) -> None:
         if self.flash_process is not None:
             self._log("Flash already in progress")
             return
+        if self._preflight is not None:
+            self._log("Flash preflight already running")
+            return
         cmd = self._build_odin_command()
         if not cmd:
             self._log("Build a command first")
             return
-        odin_path = cmd[0]
-        if not Path(odin_path).exists():
+        has_files = any(edit.text().strip() for _key, edit in self._file_edit_pairs)
+        runnable = PreflightRunnable(cmd, has_files)
+        runnable.signals.finished.connect(self._preflight_done)
+        self._preflight = runnable
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    @QtCore.Slot(dict)
+    def _preflight_done(self, result: Dict) -> None:
+        self._preflight = None
+        if self.flash_process is not None:
+            return
+        if not result["odin_exists"]:
             self._log("odin4 path does not exist")
             return
-        if not any(edit.text().strip() for edit in self.file_edits.values()):
+        if not result["has_files"]:
             self._log("Select at least one firmware file")
             return
+        cmd = result["cmd"]
         confirm = QtWidgets.QMessageBox.warning(
             self,
             self._t("dlg_confirm_title"),
@@ -1388,6 +1787,11 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if confirm != QtWidgets.QMessageBox.Yes:
             return
+        # The dialog spun a nested event loop; another flash may have started
+        # while it was open.
+        if self.flash_process is not None:
+            self._log("Flash already in progress")
+            return
         self._log(f"Starting flash: {' '.join(cmd)}")
         self._set_status("flashing")
         self.flash_progress.setRange(0, 0)
@@ -1404,6 +1808,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_button.setEnabled(False)
         self._update_flash_ready()
 
+    @QtCore.Slot()
     def _stop_flash(self) -> None:
         if self.flash_process is None:
             return
@@ -1416,6 +1821,90 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_button.setEnabled(False)
         self._update_flash_ready()
 
+    def _drain_channel(self, process: QtCore.QProcess, read_all, buf: bytearray, emitted_attr: str) -> None:
+        data = read_all()
+        if data.isEmpty():
+            return
+        # QByteArray exposes the buffer protocol; extend straight from it
+        # instead of materializing an intermediate bytes copy.
+        buf += memoryview(data)
+        newline = buf.rfind(b"\n")
+        emitted = getattr(process, emitted_attr)
+        if newline < emitted:
+            return
+        # Decode ranges always end at the newline just found, so a
+        # multi-byte sequence split across reads is reassembled in buf
+        # before it is ever decoded; the memoryview avoids slicing a copy.
+        text = str(memoryview(buf)[emitted:newline], "utf-8", "replace")
+        for raw in text.splitlines():
+            line = raw.strip()
+            if line:
+                self._log(line)
+        setattr(process, emitted_attr, newline + 1)
+
+    def _wire_process_output(self, process: QtCore.QProcess, separate_channels: bool = True) -> None:
+        process._stdout_buf = bytearray()
+        process._stderr_buf = bytearray()
+        process._stdout_emitted = 0
+        process._stderr_emitted = 0
+        # QProcess emits from the GUI thread that owns it, so skip the
+        # auto-connection thread check on these hot signals.
+        process.readyReadStandardOutput.connect(
+            partial(self._drain_channel, process, process.readAllStandardOutput,
+                    process._stdout_buf, "_stdout_emitted"),
+            QtCore.Qt.DirectConnection,
+        )
+        if separate_channels:
+            process.readyReadStandardError.connect(
+                partial(self._drain_channel, process, process.readAllStandardError,
+                        process._stderr_buf, "_stderr_emitted"),
+                QtCore.Qt.DirectConnection,
+            )
+        process.errorOccurred.connect(self._on_process_error)
+
+    @QtCore.Slot(QtCore.QProcess.ProcessError)
+    def _on_process_error(self, error: QtCore.QProcess.ProcessError) -> None:
+        self._log(PROCESS_ERROR_MESSAGES.get(error, "Process error: unknown"))
+
+    def _flush_process_tail(self, process: QtCore.QProcess) -> None:
+        for buf, emitted in (
+            (process._stdout_buf, process._stdout_emitted),
+            (process._stderr_buf, process._stderr_emitted),
+        ):
+            tail = str(memoryview(buf)[emitted:], "utf-8", "replace").strip()
+            if tail:
+                self._log(tail)
+        process._stdout_emitted = len(process._stdout_buf)
+        process._stderr_emitted = len(process._stderr_buf)
+
+    def _start_poll(self, attr: str, program: str, args: List[str], on_finish) -> None:
+        process = getattr(self, attr)
+        if process is None:
+            process = QtCore.QProcess(self)
+            process.setWorkingDirectory(str(ROOT_DIR))
+            process.setProcessChannelMode(QtCore.QProcess.SeparateChannels)
+            self._wire_process_output(process)
+
+            def poll_finished(exit_code: int, _status: QtCore.QProcess.ExitStatus) -> None:
+                self._flush_process_tail(process)
+                on_finish(
+                    process._stdout_buf.decode("utf-8", errors="replace"),
+                    process._stderr_buf.decode("utf-8", errors="replace"),
+                    exit_code,
+                )
+
+            process.finished.connect(poll_finished, QtCore.Qt.DirectConnection)
+            setattr(self, attr, process)
+        if process.state() != QtCore.QProcess.NotRunning:
+            return
+        process._stdout_buf.clear()
+        process._stderr_buf.clear()
+        process._stdout_emitted = 0
+        process._stderr_emitted = 0
+        process.setProgram(program)
+        process.setArguments(args)
+        process.start()
+
     def _run_process(
         self,
         name: str,
@@ -1428,53 +1917,81 @@ class MainWindow(QtWidgets.QMainWindow):
         process.setProgram(program)
         process.setArguments(args)
         process.setWorkingDirectory(str(ROOT_DIR))
-        process.setProcessChannelMode(QtCore.QProcess.SeparateChannels)
-        process._stdout = ""
-        process._stderr = ""
+        # Nothing downstream of one-shot helpers distinguishes the streams
+        # (the handlers either ignore the text or read the interleaved log),
+        # so merge them and take a single readyRead wake per burst.
+        process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self._wire_process_output(process, separate_channels=False)
+
+        def release_process() -> None:
+            # Drop the captured output and the signal closures right away
+            # instead of letting them live until deleteLater reaps the
+            # wrapper a turn later - a verbose flash log is tens of MB.
+            # One-shot helpers run merged, so readyReadStandardError was
+            # never connected; disconnect only the wires we made.
+            for sig in (
+                process.readyReadStandardOutput,
+                process.errorOccurred,
+                process.finished,
+            ):
+                try:
+                    sig.disconnect()
+                except RuntimeError:
+                    pass
+            process._stdout_buf = bytearray()
+            process._stderr_buf = bytearray()
+            self.other_processes.discard(process)
+            _delete_process_later(process)
 
-        def handle_output(is_error: bool) -> None:
-            if is_error:
-                data = process.readAllStandardError()
-            else:
-                data = process.readAllStandardOutput()
-            text = bytes(data).decode("utf-8", errors="replace")
-            if not text:
+        def finished(exit_code: int, _status: QtCore.QProcess.ExitStatus) -> None:
+            self._flush_process_tail(process)
+            if on_finish is None:
+                release_process()
                 return
-            for line in text.splitlines():
-                if line.strip():
-                    self._log(line.strip())
-            if is_error:
-                process._stderr += text
-            else:
-                process._stdout += text
+            runnable = OutputDecodeRunnable(
+                process._stdout_buf, process._stderr_buf, exit_code
+            )
 
-        process.readyReadStandardOutput.connect(lambda: handle_output(False))
-        process.readyReadStandardError.connect(lambda: handle_output(True))
+            def deliver(result: Dict) -> None:
+                self._decode_workers.discard(runnable)
+                on_finish(result["stdout"], result["stderr"], result["exit_code"])
+                release_process()
 
-        def finished(exit_code: int, _status: QtCore.QProcess.ExitStatus) -> None:
-            if on_finish:
-                on_finish(process._stdout, process._stderr, exit_code)
-            if process in self.other_processes:
-                self.other_processes.remove(process)
-            process.deleteLater()
+            runnable.signals.finished.connect(deliver)
+            self._decode_workers.add(runnable)
+            QtCore.QThreadPool.globalInstance().start(runnable)
 
-        process.finished.connect(finished)
-        process.errorOccurred.connect(lambda err: self._log(f"Process error: {err}"))
+        process.finished.connect(finished, QtCore.Qt.DirectConnection)
 
         process.start()
         if not is_flash:
-            self.other_processes.append(process)
+            self.other_processes.add(process)
         return process
 
 
 def main() -> None:
+    import signal
+
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("odin")
     signal.signal(signal.SIGINT, lambda *_args: app.quit())
     signal.signal(signal.SIGTERM, lambda *_args: app.quit())
-    sig_timer = QtCore.QTimer()
-    sig_timer.start(200)
-    sig_timer.timeout.connect(lambda: None)
+    # Wake the Qt event loop through a pipe when a signal arrives instead of
+    # polling with a keepalive timer; draining the pipe re-enters the
+    # interpreter, which is when the Python-level handlers above run.
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
+    notifier = QtCore.QSocketNotifier(read_fd, QtCore.QSocketNotifier.Read)
+
+    def _drain_signal_pipe() -> None:
+        try:
+            os.read(read_fd, 64)
+        except OSError:
+            pass
+
+    notifier.activated.connect(_drain_signal_pipe)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Embed theme.qss as a Python constant for frozen builds.
+
+Run before PyInstaller packaging; writes odin4_gui/_theme_qss.py so the
+frozen app skips the runtime file read. The generated module is optional:
+_load_theme_qss falls back to reading theme.qss when it is absent.
+"""
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "odin4_gui"
+
+
+def main() -> None:
+    qss = (APP_DIR / "theme.qss").read_text(encoding="utf-8")
+    target = APP_DIR / "_theme_qss.py"
+    target.write_text(
+        '"""Generated by tools/embed_theme.py -- do not edit."""\n\n'
+        f"THEME_QSS = {qss!r}\n",
+        encoding="utf-8",
+    )
+    print(f"wrote {target}")
+
+
+if __name__ == "__main__":
+    main()